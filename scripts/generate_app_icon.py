@@ -10,22 +10,111 @@ Licensed under the MIT License
 import sys
 import os
 import argparse
+import fnmatch
 import subprocess
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import math
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
 
 try:
     import numpy as np
     import trimesh
-    import svgwrite
     from PIL import Image, ImageDraw
 except ImportError as e:
     print(f"Error: Missing required Python packages")
-    print(f"Please install: pip install numpy trimesh svgwrite pillow")
+    print(f"Please install: pip install numpy trimesh pillow")
     print(f"Missing: {e}")
     sys.exit(1)
 
+try:
+    # Optional: fused per-face kernel (falls back to NumPy without it)
+    import numba
+except ImportError:
+    numba = None
+
+# Mesh geometry as (vertices (N, 3) float32, faces (M, 3) int32)
+MeshArrays = Tuple[np.ndarray, np.ndarray]
+
+
+def load_first_mesh(stl_paths: List[Path]) -> Tuple[Optional[Path], Optional[MeshArrays],
+                                                    List[Tuple[Path, str]]]:
+    """Load the first of stl_paths that trimesh can parse (runs in a worker process)"""
+    failures = []
+    for stl_path in stl_paths:
+        try:
+            mesh = trimesh.load(stl_path)
+            # Only vertices and faces are needed; float32/int32 halves the
+            # memory traffic of the transform and render stages
+            arrays = (mesh.vertices.astype(np.float32), mesh.faces.astype(np.int32))
+            return stl_path, arrays, failures
+        except Exception as e:
+            failures.append((stl_path, str(e)))
+
+    return None, None, failures
+
+
+if numba is not None:
+    # No fastmath: reassociation would make the output differ from the
+    # NumPy path in project_shade, so coordinates and depths are computed
+    # in float32 with the same operation order
+    @numba.njit(parallel=True, cache=True)
+    def project_shade_kernel(vertices, faces, icon_size, light_dir, base_color):
+        """Project, cull and shade every face in a single pass"""
+        num_faces = faces.shape[0]
+        coords = np.empty((num_faces, 6), np.float32)
+        colors = np.empty((num_faces, 3), np.uint8)
+        depth = np.empty(num_faces, np.float32)
+        visible = np.empty(num_faces, np.bool_)
+
+        light_len = math.sqrt(light_dir[0] ** 2 + light_dir[1] ** 2 + light_dir[2] ** 2)
+        lx = light_dir[0] / light_len
+        ly = light_dir[1] / light_len
+        lz = light_dir[2] / light_len
+
+        for i in numba.prange(num_faces):
+            v0 = faces[i, 0]
+            v1 = faces[i, 1]
+            v2 = faces[i, 2]
+
+            # Face normal
+            e1x = vertices[v1, 0] - vertices[v0, 0]
+            e1y = vertices[v1, 1] - vertices[v0, 1]
+            e1z = vertices[v1, 2] - vertices[v0, 2]
+            e2x = vertices[v2, 0] - vertices[v0, 0]
+            e2y = vertices[v2, 1] - vertices[v0, 1]
+            e2z = vertices[v2, 2] - vertices[v0, 2]
+            nx = e1y * e2z - e1z * e2y
+            ny = e1z * e2x - e1x * e2z
+            nz = e1x * e2y - e1y * e2x
+
+            # Orthographic projection, flip Y for SVG coordinates
+            min_x = max_x = vertices[v0, 0]
+            min_y = max_y = icon_size - vertices[v0, 1]
+            for k in range(3):
+                v = faces[i, k]
+                x = vertices[v, 0]
+                y = icon_size - vertices[v, 1]
+                coords[i, 2 * k] = x
+                coords[i, 2 * k + 1] = y
+                min_x = min(min_x, x)
+                max_x = max(max_x, x)
+                min_y = min(min_y, y)
+                max_y = max(max_y, y)
+
+            depth[i] = (vertices[v0, 2] + vertices[v1, 2] + vertices[v2, 2]) / np.float32(3.0)
+            visible[i] = (nz >= 0 and max_x >= 0 and min_x <= icon_size and
+                          max_y >= 0 and min_y <= icon_size)
+
+            # Lambertian shading with ambient light
+            length = math.sqrt(nx * nx + ny * ny + nz * nz) + 1e-10
+            intensity = max((nx * lx + ny * ly + nz * lz) / length, 0.0) * 0.7 + 0.3
+            for k in range(3):
+                colors[i, k] = min(max(int(base_color[k] * intensity), 0), 255)
+
+        return coords, colors, depth, visible
+
 
 class IconGenerator:
     """Generates app icons from 3D STL contour layers"""
@@ -33,12 +122,19 @@ class IconGenerator:
     def __init__(self, output_dir: Path, icon_size: int = 1024):
         self.output_dir = output_dir
         self.icon_size = icon_size
-        self.meshes: List[Tuple[trimesh.Trimesh, int]] = []  # (mesh, layer_number)
+        self.meshes: List[Tuple[np.ndarray, np.ndarray, int]] = []  # (vertices, faces, layer_number)
 
     def load_stl_layers(self, stl_dir: Path, layer_numbers: List[int]):
         """Load STL files for specified layer numbers"""
         print(f"Loading STL layers from {stl_dir}")
 
+        # Scan the directory once and match every layer against the cached names
+        with os.scandir(stl_dir) as entries:
+            stl_names = [entry.name for entry in entries
+                         if entry.name.endswith('.stl') and entry.is_file()]
+
+        # Resolve each layer to its candidate files, one per naming pattern
+        layer_candidates = []
         for layer_num in layer_numbers:
             # Try different naming patterns
             patterns = [
@@ -47,22 +143,27 @@ class IconGenerator:
                 f"*-{layer_num:02d}.stl",
             ]
 
-            found = False
+            candidates = []
             for pattern in patterns:
-                stl_files = list(stl_dir.glob(pattern))
-                if stl_files:
-                    stl_path = stl_files[0]
-                    print(f"  Loading layer {layer_num}: {stl_path.name}")
-                    try:
-                        mesh = trimesh.load(stl_path)
-                        self.meshes.append((mesh, layer_num))
-                        found = True
-                        break
-                    except Exception as e:
-                        print(f"  Warning: Failed to load {stl_path}: {e}")
-
-            if not found:
+                stl_files = fnmatch.filter(stl_names, pattern)
+                if stl_files and stl_dir / stl_files[0] not in candidates:
+                    candidates.append(stl_dir / stl_files[0])
+
+            layer_candidates.append(candidates)
+
+        # STL parsing is CPU-bound and independent per layer, so load in parallel
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(load_first_mesh, layer_candidates))
+
+        for layer_num, (stl_path, arrays, failures) in zip(layer_numbers, results):
+            for failed_path, error in failures:
+                print(f"  Warning: Failed to load {failed_path}: {error}")
+            if arrays is None:
                 print(f"  Warning: No STL file found for layer {layer_num}")
+                continue
+            print(f"  Loaded layer {layer_num}: {stl_path.name}")
+            vertices, faces = arrays
+            self.meshes.append((vertices, faces, layer_num))
 
         print(f"Loaded {len(self.meshes)} layers")
         return len(self.meshes) > 0
@@ -84,20 +185,25 @@ class IconGenerator:
         # Combine rotations
         transform = trimesh.transformations.concatenate_matrices(rx, ry)
 
-        # Apply to all meshes
-        for mesh, layer_num in self.meshes:
-            mesh.apply_transform(transform)
+        # Apply to all meshes. This is kept separate from the normalize
+        # transform: exact icon bounds need the rotated vertices, so the
+        # vertices are rotated here and normalize_meshes makes one more pass.
+        # A plain float32 matmul per mesh avoids trimesh's float64 copies
+        linear = transform[:3, :3].T.astype(np.float32)
+        offset = transform[:3, 3].astype(np.float32)
+        self.meshes = [(vertices @ linear + offset, faces, layer_num)
+                       for vertices, faces, layer_num in self.meshes]
 
     def compute_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
         """Compute bounding box of all meshes"""
         if not self.meshes:
             return np.zeros(3), np.ones(3)
 
-        all_vertices = np.vstack([mesh.vertices for mesh, _ in self.meshes])
-        bounds_min = np.min(all_vertices, axis=0)
-        bounds_max = np.max(all_vertices, axis=0)
+        # Reduce each mesh separately to avoid stacking every vertex
+        per_mesh_min = np.array([vertices.min(axis=0) for vertices, _, _ in self.meshes])
+        per_mesh_max = np.array([vertices.max(axis=0) for vertices, _, _ in self.meshes])
 
-        return bounds_min, bounds_max
+        return per_mesh_min.min(axis=0), per_mesh_max.max(axis=0)
 
     def normalize_meshes(self):
         """Normalize meshes to fit in icon space with padding"""
@@ -111,110 +217,184 @@ class IconGenerator:
         # Scale to fit with 10% padding
         scale = (self.icon_size * 0.8) / max_size
 
-        # Center and scale all meshes
-        for mesh, _ in self.meshes:
-            # Translate to origin
-            mesh.vertices -= center
-            # Scale
-            mesh.vertices *= scale
-            # Translate to icon center
-            mesh.vertices[:, 0] += self.icon_size / 2
-            mesh.vertices[:, 1] += self.icon_size / 2
-
-    def compute_lighting(self, normal: np.ndarray, light_dir: np.ndarray) -> float:
-        """Compute lighting intensity for a surface normal"""
-        # Normalize vectors
-        normal = normal / (np.linalg.norm(normal) + 1e-10)
-        light_dir = light_dir / (np.linalg.norm(light_dir) + 1e-10)
+        # Translate to origin, scale, then translate X/Y to icon center,
+        # folded into a single scale and offset
+        offset = -center * scale
+        offset[:2] += self.icon_size / 2
+        scale = np.float32(scale)
+        offset = offset.astype(np.float32)
+
+        # Center and scale all meshes in one pass, staying in float32
+        self.meshes = [(vertices * scale + offset, faces, layer_num)
+                       for vertices, faces, layer_num in self.meshes]
+
+    def compute_lighting(self, normals: np.ndarray, light_dir: np.ndarray) -> np.ndarray:
+        """Compute lighting intensities for an (M, 3) array of surface normals"""
+        # Normalize light direction once; normal lengths are divided out below
+        light_dir = light_dir / np.sqrt(light_dir @ light_dir)
+        lengths = np.sqrt(np.einsum('ij,ij->i', normals, normals)) + 1e-10
 
         # Lambertian shading
-        intensity = np.dot(normal, light_dir)
+        intensity = np.einsum('ij,j->i', normals, light_dir) / lengths
 
         # Clamp to [0, 1], add ambient light
-        intensity = max(0, intensity) * 0.7 + 0.3
+        return np.clip(intensity, 0, None) * 0.7 + 0.3
+
+    def project_shade(self, vertices: np.ndarray, faces: np.ndarray, light_dir: np.ndarray,
+                      base_color: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Project and shade visible faces
+
+        Returns (M, 3, 2) SVG coordinates, (M, 3) uint8 lit colors and (M,)
+        centroid depths for the front-facing faces that overlap the icon.
+        """
+        if numba is not None:
+            coords, colors, depth, visible = project_shade_kernel(
+                vertices, faces, vertices.dtype.type(self.icon_size), light_dir, base_color)
+            return coords[visible].reshape(-1, 3, 2), colors[visible], depth[visible]
 
-        return intensity
+        # Gather triangle vertices for all faces at once: (M, 3, 3)
+        tris = vertices[faces]
+
+        # Compute face normals
+        edge1 = tris[:, 1] - tris[:, 0]
+        edge2 = tris[:, 2] - tris[:, 0]
+        normals = np.cross(edge1, edge2)
+
+        # Project to 2D (orthographic projection, flip Y for SVG coordinates)
+        tris_2d = tris[:, :, :2].copy()
+        tris_2d[:, :, 1] = tris.dtype.type(self.icon_size) - tris_2d[:, :, 1]
+
+        # Only render front-facing polygons (normal pointing toward viewer)
+        # that overlap the icon area
+        proj_min = tris_2d.min(axis=1)
+        proj_max = tris_2d.max(axis=1)
+        visible = ((normals[:, 2] >= 0) &
+                   (proj_max[:, 0] >= 0) & (proj_min[:, 0] <= self.icon_size) &
+                   (proj_max[:, 1] >= 0) & (proj_min[:, 1] <= self.icon_size))
+
+        # Compute lighting for the visible faces
+        intensity = self.compute_lighting(normals[visible], light_dir)
+
+        # Apply lighting: (M, 3) fill colors
+        colors = np.clip((base_color * intensity[:, None]).astype(int),
+                         0, 255).astype(np.uint8)
+
+        # Centroid depth, summed in the same order as project_shade_kernel
+        depth = (tris[visible, 0, 2] + tris[visible, 1, 2] + tris[visible, 2, 2]) / tris.dtype.type(3)
+
+        return tris_2d[visible], colors, depth
 
     def generate_svg(self, output_path: Path):
         """Generate SVG visualization with lighting"""
         print(f"Generating SVG: {output_path}")
 
-        dwg = svgwrite.Drawing(str(output_path), size=(self.icon_size, self.icon_size))
-
-        # Background (transparent for better compositing)
-        dwg.add(dwg.rect(insert=(0, 0), size=(self.icon_size, self.icon_size),
-                        fill='none'))
-
         # Light from right (positive X direction, slightly from above)
         light_dir = np.array([1.0, 0.0, 0.3])
 
         # Process layers from bottom to top for proper Z-ordering
-        sorted_meshes = sorted(self.meshes, key=lambda x: np.mean(x[0].vertices[:, 2]))
-
-        for mesh, layer_num in sorted_meshes:
-            # Project faces to 2D and compute lighting
-            for face_idx, face in enumerate(mesh.faces):
-                vertices_3d = mesh.vertices[face]
-
-                # Compute face normal
-                v0, v1, v2 = vertices_3d
-                edge1 = v1 - v0
-                edge2 = v2 - v0
-                normal = np.cross(edge1, edge2)
-
-                # Only render front-facing polygons (normal pointing toward viewer)
-                if normal[2] < 0:
-                    continue
-
-                # Compute lighting
-                intensity = self.compute_lighting(normal, light_dir)
-
-                # Project to 2D (orthographic projection, flip Y for SVG coordinates)
-                vertices_2d = vertices_3d[:, :2].copy()
-                vertices_2d[:, 1] = self.icon_size - vertices_2d[:, 1]
-
-                # Create color based on layer and lighting
-                # Use a gradient from blue (bottom) to white (top)
-                layer_ratio = layer_num / 11.0
-                base_color = np.array([
-                    int(255 * (0.2 + 0.8 * layer_ratio)),  # R
-                    int(255 * (0.4 + 0.6 * layer_ratio)),  # G
-                    int(255 * (0.6 + 0.4 * layer_ratio)),  # B
-                ])
-
-                # Apply lighting
-                color = (base_color * intensity).astype(int)
-                color = np.clip(color, 0, 255)
-
-                fill_color = f'rgb({color[0]},{color[1]},{color[2]})'
-
-                # Add polygon
-                points = [(x, y) for x, y in vertices_2d]
-                dwg.add(dwg.polygon(points=points,
-                                   fill=fill_color,
-                                   stroke='none'))
-
-        dwg.save()
-        print(f"  Saved SVG with {sum(len(m[0].faces) for m in self.meshes)} faces")
-
-    def svg_to_png(self, svg_path: Path, png_path: Path, size: int):
-        """Convert SVG to PNG at specified size"""
-        print(f"  Converting to PNG {size}x{size}: {png_path.name}")
+        depth_keys = [vertices[:, 2].mean() for vertices, _, _ in self.meshes]
+        sorted_meshes = [self.meshes[i] for i in np.argsort(depth_keys, kind='stable')]
+
+        # Base color for every layer number, looked up per mesh
+        # Use a gradient from blue (bottom) to white (top)
+        max_layer = max(layer_num for _, _, layer_num in self.meshes) if self.meshes else 0
+        layer_ratio = np.arange(max_layer + 1) / 11.0
+        layer_colors = (255 * np.stack([
+            0.2 + 0.8 * layer_ratio,  # R
+            0.4 + 0.6 * layer_ratio,  # G
+            0.6 + 0.4 * layer_ratio,  # B
+        ], axis=1)).astype(int)
+
+        # The SVG is assembled as raw XML strings and written in one go;
+        # building an svgwrite element per face dominates the runtime for
+        # meshes with thousands of faces
+        parts = [
+            '<?xml version="1.0" encoding="utf-8" ?>',
+            f'<svg xmlns="http://www.w3.org/2000/svg" version="1.1" '
+            f'width="{self.icon_size}" height="{self.icon_size}">',
+            # Background (transparent for better compositing)
+            f'<rect x="0" y="0" width="{self.icon_size}" '
+            f'height="{self.icon_size}" fill="none"/>',
+        ]
+
+        total_faces = 0
+        for vertices, faces, layer_num in sorted_meshes:
+            tris_2d, colors, depth = self.project_shade(vertices, faces, light_dir,
+                                                        layer_colors[layer_num])
+            if len(tris_2d) == 0:
+                continue
+
+            # Within the layer, draw faces back to front (painter's algorithm)
+            face_order = np.argsort(depth, kind='stable')
+            tris_2d = tris_2d[face_order]
+
+            # Snap colors to 5 bits per channel so that neighbouring faces
+            # can share a fill
+            colors = (colors[face_order] >> 3) << 3
+
+            # Group consecutive faces with the same fill under one <g>.
+            # Runs are not merged across the mesh, which would break the
+            # painter's ordering of overlapping faces.
+            keys = ((colors[:, 0].astype(np.uint32) << 16) |
+                    (colors[:, 1].astype(np.uint32) << 8) | colors[:, 2])
+            run_starts = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+            run_bounds = [0] + run_starts.tolist() + [len(keys)]
+
+            # Add polygons, coordinates rounded to 1 decimal
+            polygons = [f'<polygon points="{x0:.1f},{y0:.1f} {x1:.1f},{y1:.1f} '
+                        f'{x2:.1f},{y2:.1f}"/>'
+                        for x0, y0, x1, y1, x2, y2 in tris_2d.reshape(-1, 6).tolist()]
+            total_faces += len(polygons)
+            for start, end in zip(run_bounds[:-1], run_bounds[1:]):
+                r, g, b = colors[start].tolist()
+                parts.append(f'<g fill="rgb({r},{g},{b})">')
+                parts.extend(polygons[start:end])
+                parts.append('</g>')
+
+        parts.append('</svg>')
+        output_path.write_text('\n'.join(parts) + '\n', encoding='utf-8')
+
+        print(f"  Saved SVG with {total_faces} faces")
+
+    def rasterize_master(self, svg_path: Path, size: int = 1024) -> Image.Image:
+        """Rasterize SVG once at the largest icon size"""
+        print(f"Rasterizing master PNG {size}x{size}")
 
         try:
-            # Try using cairosvg (if available)
-            import cairosvg
-            cairosvg.svg2png(url=str(svg_path), write_to=str(png_path),
-                           output_width=size, output_height=size)
+            # Prefer resvg (faster, thread-safe)
+            import resvg_py
+            png_data = bytes(resvg_py.svg_to_bytes(svg_path=str(svg_path),
+                                                   width=size, height=size))
         except ImportError:
-            # Fallback: Use PIL to create a simple rasterization
-            # This won't be as good but will work without cairosvg
-            print("    Note: cairosvg not available, using PIL fallback")
-            img = Image.new('RGBA', (size, size), (255, 255, 255, 0))
-            img.save(png_path)
-
-    def generate_icns(self, svg_path: Path, output_path: Path):
-        """Generate macOS .icns file from SVG"""
+            try:
+                import cairosvg
+            except ImportError:
+                raise RuntimeError("No SVG rasterizer available. "
+                                   "Please install: pip install resvg-py (or cairosvg)")
+            png_data = cairosvg.svg2png(url=str(svg_path),
+                                        output_width=size, output_height=size)
+
+        return Image.open(BytesIO(png_data)).convert('RGBA')
+
+    def save_png(self, master: Image.Image, png_path: Path, size: int):
+        """Downsample the master raster and save it as PNG at specified size"""
+        if master.size != (size, size):
+            master = master.resize((size, size), Image.LANCZOS)
+        master.save(png_path)
+
+    def save_pngs(self, master: Image.Image, targets: List[Tuple[Path, int]]):
+        """Downsample and save several PNGs concurrently"""
+        # PIL releases the GIL while resizing and encoding, so threads scale
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = []
+            for png_path, size in targets:
+                print(f"  Converting to PNG {size}x{size}: {png_path.name}")
+                futures.append(executor.submit(self.save_png, master, png_path, size))
+            for future in futures:
+                future.result()
+
+    def generate_icns(self, master: Image.Image, output_path: Path):
+        """Generate macOS .icns file from the master raster"""
         print(f"Generating macOS .icns: {output_path}")
 
         # Create temporary iconset directory
@@ -226,9 +406,8 @@ class IconGenerator:
                  (128, '128x128'), (256, '128x128@2x'), (256, '256x256'),
                  (512, '256x256@2x'), (512, '512x512'), (1024, '512x512@2x')]
 
-        for size, name in sizes:
-            png_path = iconset_dir / f"icon_{name}.png"
-            self.svg_to_png(svg_path, png_path, size)
+        self.save_pngs(master, [(iconset_dir / f"icon_{name}.png", size)
+                                for size, name in sizes])
 
         # Use iconutil to create .icns
         try:
@@ -243,27 +422,18 @@ class IconGenerator:
         import shutil
         shutil.rmtree(iconset_dir, ignore_errors=True)
 
-    def generate_ico(self, svg_path: Path, output_path: Path):
-        """Generate Windows .ico file from SVG"""
+    def generate_ico(self, master: Image.Image, output_path: Path):
+        """Generate Windows .ico file from the master raster"""
         print(f"Generating Windows .ico: {output_path}")
 
-        # Generate PNGs at various sizes
+        # Downsample in memory; no temporary PNG files are needed
         sizes = [16, 32, 48, 64, 128, 256]
-        pngs = []
-
-        for size in sizes:
-            png_path = output_path.parent / f"temp_icon_{size}.png"
-            self.svg_to_png(svg_path, png_path, size)
-            pngs.append(Image.open(png_path))
+        images = [master.resize((s, s), Image.LANCZOS) for s in sizes]
 
-        # Save as .ico
-        pngs[0].save(output_path, format='ICO', sizes=[(s, s) for s in sizes],
-                    append_images=pngs[1:])
-
-        # Clean up temp PNGs
-        for size in sizes:
-            png_path = output_path.parent / f"temp_icon_{size}.png"
-            png_path.unlink(missing_ok=True)
+        # Save as .ico; PIL drops any size larger than the base image, so
+        # the largest image is the base and the rest are appended
+        images[-1].save(output_path, format='ICO', sizes=[(s, s) for s in sizes],
+                        append_images=images[:-1])
 
         print(f"  Created {output_path}")
 
@@ -276,22 +446,26 @@ class IconGenerator:
         master_svg = icons_dir / "app_icon.svg"
         self.generate_svg(master_svg)
 
+        # Rasterize once; every PNG size is downsampled from this
+        master = self.rasterize_master(master_svg)
+
         # Generate macOS .icns
         icns_path = icons_dir / "app_icon.icns"
-        self.generate_icns(master_svg, icns_path)
+        self.generate_icns(master, icns_path)
 
         # Generate Windows .ico
         ico_path = icons_dir / "app_icon.ico"
-        self.generate_ico(master_svg, ico_path)
+        self.generate_ico(master, ico_path)
 
         # Generate Linux PNGs
         print("Generating Linux PNG icons")
         hicolor_dir = icons_dir / "hicolor"
+        linux_pngs = []
         for size in [16, 32, 48, 64, 128, 256, 512]:
             size_dir = hicolor_dir / f"{size}x{size}" / "apps"
             size_dir.mkdir(parents=True, exist_ok=True)
-            png_path = size_dir / "topo-gen-gui.png"
-            self.svg_to_png(master_svg, png_path, size)
+            linux_pngs.append((size_dir / "topo-gen-gui.png", size))
+        self.save_pngs(master, linux_pngs)
 
         print("\n✓ Icon generation complete!")
         print(f"  Master SVG: {master_svg}")
@@ -344,7 +518,11 @@ def main():
     generator.normalize_meshes()
 
     # Generate all icon formats
-    generator.generate_all_formats()
+    try:
+        generator.generate_all_formats()
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
 
     return 0
 